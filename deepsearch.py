@@ -6,17 +6,24 @@ Deepsearch - 개선된 UI/UX (Design System 적용)
 progress_var(Progressbar)가 우측하단에 고정되도록 수정
 """
 
+import io
+import json
 import os
 import re
 import time
 import logging
+import multiprocessing
+import queue
 import subprocess
 import threading
 import zipfile
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Callable, Tuple
+from contextlib import closing, nullcontext
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, Callable, Tuple
 from datetime import datetime
 
 import fitz  # PyMuPDF
@@ -59,6 +66,16 @@ try:
 except Exception as e:
     logger.error("hwp5 패치 실패: " + str(e))
 
+# -------------------------------------------------------------
+# hwp5 텍스트 변환 API (프로세스 내 호출, 없으면 hwp5txt 실행)
+# -------------------------------------------------------------
+try:
+    from hwp5.xmlmodel import Hwp5File
+    from hwp5.hwp5txt import TextTransform
+except Exception:
+    Hwp5File = None
+    TextTransform = None
+
 # -------------------------------------------------------------
 # 드래그 앤 드롭 지원 (tkinterdnd2 사용, 없으면 기본 Tk)
 # -------------------------------------------------------------
@@ -68,6 +85,34 @@ try:
 except ImportError:
     DnDTk = tk.Tk
 
+# -------------------------------------------------------------
+# Excel 고속 리더 (python-calamine 사용, 없으면 pandas/openpyxl)
+# -------------------------------------------------------------
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# -------------------------------------------------------------
+# XML 스트리밍 파서 (lxml 사용, 없으면 표준 ElementTree)
+# -------------------------------------------------------------
+try:
+    from lxml import etree as xml_etree
+    XML_ITERPARSE_OPTIONS = {"huge_tree": True, "recover": True}
+except ImportError:
+    xml_etree = ET
+    XML_ITERPARSE_OPTIONS = {}
+
+# -------------------------------------------------------------
+# 폴더 변경 감시 (watchdog 사용, 없으면 주기적 자동 색인)
+# -------------------------------------------------------------
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # -------------------------------------------------------------
 # 디자인 시스템: COLORS, FONTS
 # -------------------------------------------------------------
@@ -152,6 +197,23 @@ def create_themed_style(root: tk.Tk) -> None:
         font=(FONTS['default'], FONTS['sizes']['normal'])
     )
 
+    style.configure('Results.Treeview',
+        background=COLORS['background'],
+        fieldbackground=COLORS['background'],
+        foreground=COLORS['text_primary'],
+        font=(FONTS['default'], FONTS['sizes']['normal']),
+        rowheight=30,
+        borderwidth=0
+    )
+    style.configure('Results.Treeview.Heading',
+        font=(FONTS['default'], FONTS['sizes']['normal'], FONTS['weights']['bold']),
+        foreground=COLORS['text_secondary']
+    )
+    style.map('Results.Treeview',
+        background=[('selected', COLORS['hover_background'])],
+        foreground=[('selected', COLORS['text_primary'])]
+    )
+
 # -------------------------------------------------------------
 # 파일 파서 추상 클래스 및 전용 파서
 # -------------------------------------------------------------
@@ -160,8 +222,38 @@ class BaseFileParser(ABC):
     def parse(self, file_path: str) -> str:
         pass
 
+_hwp_text_transform = None
+
+def _get_hwp_text_transform() -> Callable:
+    # transform_hwp5_to_text는 접근할 때마다 XSLT를 컴파일하므로 프로세스당 한 번만 생성
+    global _hwp_text_transform
+    if _hwp_text_transform is None:
+        _hwp_text_transform = TextTransform().transform_hwp5_to_text
+    return _hwp_text_transform
+
+def init_parse_worker() -> None:
+    # 파싱 작업자 프로세스 시작 시 무거운 파서 상태를 미리 준비
+    if TextTransform is not None:
+        try:
+            _get_hwp_text_transform()
+        except Exception as e:
+            logger.warning(f"HWP 변환기 초기화 실패: {e}")
+
 class HWPParser(BaseFileParser):
     def parse(self, file_path: str) -> str:
+        if TextTransform is None:
+            return self._parse_with_hwp5txt(file_path)
+        try:
+            output = io.BytesIO()
+            with closing(Hwp5File(file_path)) as hwp5file:
+                _get_hwp_text_transform()(hwp5file, output)
+            return output.getvalue().decode("utf-8", errors="ignore").strip()
+        except Exception as e:
+            logger.error(f"[HWPParser] 예외 발생 ({file_path}): {e}")
+            return ""
+
+    @staticmethod
+    def _parse_with_hwp5txt(file_path: str) -> str:
         try:
             output = subprocess.check_output(
                 ["hwp5txt", file_path],
@@ -178,23 +270,24 @@ class HWPParser(BaseFileParser):
             return ""
 
 class HWPXParser(BaseFileParser):
+    XML_SUFFIXES = (".xml", ".XML")
+    # 본문 텍스트가 없는 스타일/관계 정의 파일은 건너뜀
+    SKIP_ENTRIES = frozenset({"Contents/header.xml"})
+    READ_BUFFER_SIZE = 1 << 20
+
     def parse(self, file_path: str) -> str:
         texts = []
         try:
             with zipfile.ZipFile(file_path, 'r') as z:
-                for name in z.namelist():
-                    if name.startswith("Contents/") and name.lower().endswith(".xml"):
-                        try:
-                            with z.open(name) as f:
-                                tree = ET.parse(f)
-                                root = tree.getroot()
-                                for elem in root.iter():
-                                    if '}' in elem.tag:
-                                        elem.tag = elem.tag.split('}', 1)[1]
-                                text = "".join(root.itertext())
-                                texts.append(text)
-                        except Exception as xe:
-                            logger.error(f"[HWPXParser] XML 파싱 오류 ({name} in {file_path}): {xe}")
+                names = [n for n in z.namelist()
+                         if n.startswith("Contents/") and n.endswith(self.XML_SUFFIXES)
+                         and n not in self.SKIP_ENTRIES and "/_rels/" not in n]
+                for name in names:
+                    try:
+                        with io.BufferedReader(z.open(name, 'r'), buffer_size=self.READ_BUFFER_SIZE) as f:
+                            texts.append(self._extract_text(f))
+                    except Exception as xe:
+                        logger.error(f"[HWPXParser] XML 파싱 오류 ({name} in {file_path}): {xe}")
             return "\n".join(texts).strip()
         except zipfile.BadZipFile:
             logger.error(f"[HWPXParser] 파일 형식 오류 (올바른 hwpx 파일이 아님): {file_path}")
@@ -203,48 +296,90 @@ class HWPXParser(BaseFileParser):
             logger.error(f"[HWPXParser] 파일 파싱 오류 ({file_path}): {e}")
             return ""
 
+    @staticmethod
+    def _extract_text(source) -> str:
+        # itertext()와 같은 순서(text → 자식 → tail)로 한 번에 스트리밍 추출.
+        # 끝난 요소의 자식은 바로 제거하여 전체 DOM을 메모리에 유지하지 않는다.
+        stack = [[]]
+        for event, elem in xml_etree.iterparse(source, events=("start", "end"), **XML_ITERPARSE_OPTIONS):
+            if event == "start":
+                stack.append([])
+                continue
+            parts = [elem.text or ""]
+            for child_text, child in stack.pop():
+                parts.append(child_text)
+                parts.append(child.tail or "")
+            stack[-1].append(("".join(parts), elem))
+            del elem[:]
+        return "".join(text for text, _ in stack[0])
+
 class PDFParser(BaseFileParser):
     def parse(self, file_path: str) -> str:
-        text_content = []
         try:
             with fitz.open(file_path) as pdf:
-                for page in pdf:
-                    text_content.append(page.get_text())
+                # PyMuPDF는 스레드 안전하지 않으므로 페이지는 순차 추출 (병렬화는 파일 단위로 처리)
+                return "\n".join(page.get_text("text") for page in pdf)
         except Exception as e:
             logger.error(f"[PDFParser] 파일 파싱 오류 ({file_path}): {e}")
             return ""
-        return "\n".join(text_content)
 
 class ExcelParser(BaseFileParser):
     def parse(self, file_path: str) -> str:
         text_content = []
         try:
-            xls = pd.ExcelFile(file_path)
-            for sheet_name in xls.sheet_names:
-                df = xls.parse(sheet_name=sheet_name, header=None)
-                df = df.fillna("").astype(str)
-                text_content.append(f"[Sheet: {sheet_name}]")
-                for row in df.values.tolist():
-                    text_content.append(" ".join(row))
+            if CalamineWorkbook is not None:
+                self._read_calamine(file_path, text_content)
+            else:
+                self._read_pandas(file_path, text_content)
         except Exception as e:
             logger.error(f"[ExcelParser] 파일 파싱 오류 ({file_path}): {e}")
             return ""
         return "\n".join(text_content)
 
+    @staticmethod
+    def _read_calamine(file_path: str, text_content: List[str]) -> None:
+        wb = CalamineWorkbook.from_path(file_path)
+        for sheet_name in wb.sheet_names:
+            rows = wb.get_sheet_by_name(sheet_name).to_python()
+            text_content.append(f"[Sheet: {sheet_name}]")
+            text_content.extend(" ".join("" if c is None else str(c) for c in row) for row in rows)
+
+    @staticmethod
+    def _read_pandas(file_path: str, text_content: List[str]) -> None:
+        xls = pd.ExcelFile(file_path)
+        for sheet_name in xls.sheet_names:
+            df = xls.parse(sheet_name=sheet_name, header=None)
+            text_content.append(f"[Sheet: {sheet_name}]")
+            if not df.empty:
+                rows = df.fillna("").astype(str).agg(" ".join, axis=1)
+                text_content.append("\n".join(rows.tolist()))
+
+def get_extension(path: str) -> str:
+    # os.path.splitext보다 가벼운 소문자 확장자 추출
+    dot = path.rfind(".")
+    return path[dot:].lower() if dot >= 0 else ""
+
+# 파서는 상태가 없으므로 확장자별 인스턴스를 공유
+_excel_parser = ExcelParser()
+_PARSERS = {
+    ".hwp": HWPParser(),
+    ".hwpx": HWPXParser(),
+    ".pdf": PDFParser(),
+    ".xls": _excel_parser,
+    ".xlsx": _excel_parser,
+}
+
+# 색인 대상 확장자 (파서가 등록된 확장자와 동일)
+EXT_SET = frozenset(_PARSERS)
+
 class ParserFactory:
     @staticmethod
     def get_parser(file_path: str) -> BaseFileParser:
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext == ".hwp":
-            return HWPParser()
-        elif ext == ".hwpx":
-            return HWPXParser()
-        elif ext == ".pdf":
-            return PDFParser()
-        elif ext in (".xls", ".xlsx"):
-            return ExcelParser()
-        else:
+        ext = get_extension(file_path)
+        parser = _PARSERS.get(ext)
+        if parser is None:
             raise ValueError(f"지원하지 않는 파일 확장자: {ext}")
+        return parser
 
 class FileParser:
     @staticmethod
@@ -256,111 +391,359 @@ class FileParser:
             logger.error(f"[FileParser] 파서 선택 오류 ({file_path}): {e}")
             return ""
 
+def parse_job(fpath: str, mtime_ns: int) -> Tuple[str, Optional[str], Optional[str], Optional[str], Optional[datetime], Optional[Exception]]:
+    # 작업자 프로세스에서 실행되므로 모듈 최상위에 정의 (피클 가능)
+    try:
+        extension = get_extension(fpath)
+        filename = os.path.basename(fpath)
+        content = FileParser.parse_file(fpath)
+        modified = datetime.fromtimestamp(mtime_ns / 1e9)
+        return (fpath, extension, filename, content, modified, None)
+    except Exception as e:
+        return (fpath, None, None, None, None, e)
+
+def parse_batch(jobs: List[Tuple[str, int]]) -> List[Tuple[str, Optional[str], Optional[str], Optional[str], Optional[datetime], Optional[Exception]]]:
+    # 여러 파일을 한 작업으로 묶어 프로세스 간 작업 전달/결과 반환 비용을 줄임. 결과 순서는 jobs와 같음
+    return [parse_job(fpath, mtime_ns) for fpath, mtime_ns in jobs]
+
+# 순회하지 않는 시스템/휴지통/개발 도구 폴더. 이름이 '.'으로 시작하는 숨김 폴더도 건너뜀
+SKIP_DIRS = frozenset({"$RECYCLE.BIN", "System Volume Information", "node_modules", ".git"})
+
+def iter_document_batches(directory: str,
+                          dir_mtimes: Optional[dict] = None,
+                          failed_dirs: Optional[set] = None,
+                          stop: Optional[threading.Event] = None,
+                          _seen: Optional[set] = None) -> Iterator[List[Tuple[str, int, int]]]:
+    # os.scandir로 하위 폴더까지 순회하며 색인 대상 파일의 (경로, 수정 시간(ns), 크기)를 폴더 단위 리스트로 생성.
+    # is_dir/is_file은 디렉터리 항목의 유형 정보를 쓰므로 추가 stat 호출이 없음.
+    # 하위 폴더는 현재 폴더의 scandir 핸들을 닫은 뒤에 순회.
+    # dir_mtimes를 주면 순회한 폴더마다 {경로: 수정 시간(ns)}을 기록하고,
+    # failed_dirs를 주면 읽지 못한 폴더(오프라인 네트워크 드라이브 등)의 경로를 기록.
+    # stop이 설정되면 다음 폴더부터 순회하지 않음
+    if stop is not None and stop.is_set():
+        return
+    if _seen is None:
+        _seen = set()
+    # 항목마다 반복 조회하는 전역 이름은 지역 변수로 바인딩
+    ext_set = EXT_SET
+    skip_dirs = SKIP_DIRS
+    found = []
+    subdirs = []
+    try:
+        # 정션 등으로 같은 폴더에 다시 들어오는 순환을 막기 위해 방문한 폴더의 (장치, inode)를 기록.
+        # Windows에서는 DirEntry.stat()에 inode가 채워지지 않으므로 os.stat을 사용
+        st = os.stat(directory)
+        if st.st_ino:
+            key = (st.st_dev, st.st_ino)
+            if key in _seen:
+                return
+            _seen.add(key)
+        if dir_mtimes is not None:
+            dir_mtimes[directory] = st.st_mtime_ns
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in skip_dirs and not name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    dot = name.rfind(".")
+                    if dot >= 0 and name[dot:].lower() in ext_set:
+                        try:
+                            st = entry.stat()
+                            found.append((entry.path, st.st_mtime_ns, st.st_size))
+                        except OSError as e:
+                            logger.warning(f"파일 정보를 읽을 수 없음: {entry.path}, {e}")
+    except OSError as e:
+        logger.warning(f"폴더를 읽을 수 없음: {directory}, {e}")
+        if failed_dirs is not None:
+            failed_dirs.add(directory)
+    if found:
+        yield found
+    for subdir in subdirs:
+        yield from iter_document_batches(subdir, dir_mtimes, failed_dirs, stop, _seen)
+
 # -------------------------------------------------------------
 # IndexManager: Whoosh 인덱스 관리
 # -------------------------------------------------------------
 from whoosh.index import create_in, open_dir
-from whoosh.fields import Schema, ID, TEXT, DATETIME
+from whoosh.fields import Schema, ID, TEXT, DATETIME, STORED
 from whoosh.qparser import MultifieldParser, OrGroup, AndGroup
-from whoosh.analysis import RegexAnalyzer
+from whoosh.analysis import RegexTokenizer
+from whoosh.highlight import ContextFragmenter, Formatter, get_text, highlight
+
+class SnippetFormatter(Formatter):
+    """일치한 단어를 **단어** 형태로 감싸는 미리보기용 포매터"""
+    between = " ... "
+
+    def format_token(self, text, token, replace=False):
+        return f"**{get_text(text, token, replace)}**"
 
 class IndexManager:
+    # 파싱 작업 하나에 묶는 최대 파일 수
+    PARSE_BATCH_SIZE = 16
+    # 미리보기용으로 저장하는 본문 앞부분 글자 수 (본문 전체는 저장하지 않음). 이 범위 밖에서만
+    # 일치한 결과는 make_snippets()에서 파일을 다시 파싱해 미리보기를 만듦
+    EXCERPT_CHARS = 10000
+    # optimize()는 색인 전체를 다시 쓰므로 세그먼트가 이 개수를 넘었을 때만 병합
+    MAX_SEGMENTS = 8
+    # 추가할 문서가 이보다 많을 때만 다중 프로세스 writer 사용 (작업자 프로세스 시작 비용 때문)
+    MP_WRITER_MIN_DOCS = 500
+
     def __init__(self, index_dir: str = "indexdir") -> None:
         self.index_dir = index_dir
         self.schema = Schema(
             path=ID(stored=True, unique=True),
             filename=TEXT(stored=True),
             extension=TEXT(stored=True),
-            content=TEXT(analyzer=RegexAnalyzer(), stored=True),
+            content=TEXT(analyzer=RegexTokenizer(r"\w+"), stored=False),
+            excerpt=STORED,
             modified=DATETIME(stored=True)
         )
+        # 색인 쓰기(clear/index/optimize)는 한 번에 하나만 수행
+        self._write_lock = threading.Lock()
+        # 같은 (검색어, 모드, 정렬, 색인 세대) 재검색은 캐시에서 반환.
+        # 세대를 키에 넣어 색인 중에 끝난 검색의 이전 결과가 커밋 뒤에 다시 쓰이지 않게 함
+        self._cached_search = lru_cache(maxsize=128)(self._search)
+        # 검색마다 searcher를 새로 열지 않고 재사용 (색인이 바뀐 경우에만 refresh)
+        self._searcher = None
+        self._searcher_lock = threading.Lock()
         if not os.path.exists(self.index_dir):
             os.makedirs(self.index_dir)
             create_in(self.index_dir, self.schema)
         self.ix = open_dir(self.index_dir)
+        # 색인된 파일의 {경로: (수정 시간(ns), 크기)}. 색인과 함께 저장해 다음 실행의 증분 색인에 사용
+        self.sigs_path = os.path.join(self.index_dir, "file_sigs.json")
+        self.file_sigs = self._load_file_sigs()
+        if self.file_sigs is None or "excerpt" not in self.ix.schema:
+            # 기록이 없거나 발췌문이 없는 이전 형식의 색인이면 한 번 새로 색인
+            self.clear_index()
+
+    def _load_file_sigs(self) -> Optional[dict]:
+        try:
+            with open(self.sigs_path, "r", encoding="utf-8") as f:
+                return {path: tuple(sig) for path, sig in json.load(f).items()}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"파일 기록을 읽을 수 없음: {e}")
+            return None
 
-    def clear_index(self) -> None:
+    def _save_file_sigs(self) -> None:
+        tmp_path = self.sigs_path + ".tmp"
         try:
-            self.ix.close()
-        except Exception:
-            pass
-        for f in os.listdir(self.index_dir):
-            filepath = os.path.join(self.index_dir, f)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.file_sigs, f, ensure_ascii=False)
+            os.replace(tmp_path, self.sigs_path)
+        except Exception as e:
+            logger.warning(f"파일 기록 저장 실패: {e}")
+
+    def clear_index(self) -> None:
+        with self._write_lock:
+            self._close_searcher()
             try:
-                os.remove(filepath)
-            except Exception as e:
-                logger.warning(f"Could not remove {filepath}: {e}")
-                time.sleep(0.5)
+                self.ix.close()
+            except Exception:
+                pass
+            for f in os.listdir(self.index_dir):
+                filepath = os.path.join(self.index_dir, f)
                 try:
                     os.remove(filepath)
-                except Exception as e2:
-                    logger.warning(f"Retry failed for {filepath}: {e2}")
-        create_in(self.index_dir, self.schema)
-        self.ix = open_dir(self.index_dir)
+                except Exception as e:
+                    logger.warning(f"Could not remove {filepath}: {e}")
+                    time.sleep(0.5)
+                    try:
+                        os.remove(filepath)
+                    except Exception as e2:
+                        logger.warning(f"Retry failed for {filepath}: {e2}")
+            create_in(self.index_dir, self.schema)
+            self.ix = open_dir(self.index_dir)
+            self.file_sigs = {}
+            self._save_file_sigs()
+            self._cached_search.cache_clear()
 
     def index_files(self,
-                    file_paths: List[str],
-                    progress_callback: Optional[Callable[[int, int, float], None]] = None,
+                    file_entries: Iterable[Tuple[str, int, int]],
+                    progress_callback: Optional[Callable[[int, int, float, str], None]] = None,
                     cancel_callback: Optional[Callable[[], bool]] = None,
-                    max_workers: int = 6) -> None:
-        def parse_job(fpath: str) -> Tuple[str, Optional[str], Optional[str], Optional[str], Optional[datetime], Optional[Exception]]:
-            try:
-                extension = os.path.splitext(fpath)[1].lower()
-                filename = os.path.basename(fpath)
-                content = FileParser.parse_file(fpath)
-                modified = datetime.fromtimestamp(os.path.getmtime(fpath))
-                return (fpath, extension, filename, content, modified, None)
-            except Exception as e:
-                return (fpath, None, None, None, None, e)
-
+                    max_workers: Optional[int] = None,
+                    remove_missing: bool = False,
+                    executor: Optional[Executor] = None,
+                    unreadable_dirs: Optional[set] = None) -> int:
+        # file_entries는 순회 중인 생성기일 수 있음. 받는 즉시 파싱을 제출해 폴더 순회와 파싱을 겹침.
+        # 기록된 (수정 시간, 크기)가 같은 파일은 다시 파싱하지 않음 (증분 색인).
+        # remove_missing이면 file_entries를 전체 목록으로 보고, 목록에 없는 기존 문서는 색인에서 삭제.
+        # 단, 순회 중 읽지 못한 폴더(unreadable_dirs, 순회가 끝난 뒤에 확인) 아래의 문서는 남겨 둠.
+        # executor를 주면 그 풀을 재사용하고 종료하지 않음 (작업자 수는 max_workers와 같다고 가정).
+        # 풀이 실행 중에 망가지면 파싱된 결과를 커밋한 뒤 BrokenProcessPool을 발생시킴.
+        # 반환값은 전달받은 (변경 없어 건너뛴 파일 포함) 전체 파일 수
+        file_sigs = self.file_sigs
         results = []
-        total_files = len(file_paths)
+        seen_paths = set()
+        cancelled = False
+        # 실행 중 작업자 프로세스가 비정상 종료되면 이미 파싱한 결과까지 커밋한 뒤 다시 발생시킴
+        broken_pool = None
         start_parse_time = time.time()
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_path = {executor.submit(parse_job, f): f for f in file_paths}
-            for i, future in enumerate(as_completed(future_to_path), start=1):
+        # 파싱은 CPU 위주(GIL 보유)이므로 프로세스 풀에서 수행. 기본 작업자 수는 CPU 코어 수
+        workers = max_workers or os.cpu_count() or 1
+        if executor is None:
+            pool = ProcessPoolExecutor(max_workers=max_workers, initializer=init_parse_worker)
+        else:
+            pool = nullcontext(executor)
+        with pool as executor:
+            # 파일은 묶음 단위로 제출. 변경 파일이 적을 때도 모든 작업자가 일하도록
+            # 묶음 크기는 1부터 작업자 수만큼 제출할 때마다 1씩 늘려 PARSE_BATCH_SIZE까지 키움
+            future_to_batch = {}
+            batch = []
+            batch_size = 1
+            total_files = 0
+            for fpath, mtime_ns, size in file_entries:
+                if cancel_callback and cancel_callback():
+                    cancelled = True
+                    break
+                # 모니터링 폴더가 다른 모니터링 폴더 안에 있으면 같은 파일이 두 번 전달됨
+                if fpath in seen_paths:
+                    continue
+                seen_paths.add(fpath)
+                sig = (mtime_ns, size)
+                if file_sigs.get(fpath) == sig:
+                    continue
+                batch.append((fpath, mtime_ns, sig))
+                if len(batch) >= batch_size:
+                    future_to_batch[executor.submit(parse_batch, [(f, m) for f, m, _ in batch])] = batch
+                    total_files += len(batch)
+                    batch = []
+                    batch_size = min(self.PARSE_BATCH_SIZE, 1 + len(future_to_batch) // workers)
+            if batch and not cancelled:
+                future_to_batch[executor.submit(parse_batch, [(f, m) for f, m, _ in batch])] = batch
+                total_files += len(batch)
+            seen_files = len(seen_paths)
+            if total_files < seen_files:
+                logger.info(f"변경 없는 파일 {seen_files - total_files}개 건너뜀")
+
+            # 전체 파일 수는 순회가 끝나야 정해지므로 진행 상황 보고는 이후부터
+            # 진행 상황은 1% 단위로만 보고 (진행바 해상도와 동일). 경과 시간도 보고할 때만 계산
+            report_step = max(1, total_files // 100)
+            done = 0
+            last_reported = 0
+            for future in as_completed(future_to_batch):
                 if cancel_callback and cancel_callback():
                     logger.info("색인 중단 요청됨.")
+                    cancelled = True
+                    for pending in future_to_batch:
+                        pending.cancel()
                     break
 
-                fpath = future_to_path[future]
+                batch = future_to_batch[future]
                 try:
-                    fpath, extension, filename, content, modified, err = future.result()
-                    if err:
-                        logger.error(f"[index_files] 파싱 오류: {fpath}, {err}")
-                        if progress_callback:
-                            progress_callback(i, total_files, 0)
-                        continue
-                    results.append((fpath, extension, filename, content, modified))
+                    for (_, _, sig), (fpath, extension, filename, content, modified, err) in zip(batch, future.result()):
+                        if err:
+                            logger.error(f"[index_files] 파싱 오류: {fpath}, {err}")
+                            continue
+                        results.append((fpath, sig, extension, filename, content, modified))
+                except BrokenProcessPool as exc:
+                    logger.error(f"[index_files] 파싱 작업자 비정상 종료: {batch[0][0]} 외 {len(batch) - 1}개")
+                    broken_pool = exc
                 except Exception as exc:
-                    logger.error(f"[index_files] 예외 발생: {fpath}, {exc}")
+                    logger.error(f"[index_files] 예외 발생: {batch[0][0]} 외 {len(batch) - 1}개, {exc}")
                 finally:
-                    if progress_callback:
-                        elapsed = time.time() - start_parse_time
-                        progress_callback(i, total_files, elapsed)
+                    done += len(batch)
+                    if progress_callback and (done - last_reported >= report_step or done == total_files):
+                        last_reported = done
+                        progress_callback(done, total_files, time.time() - start_parse_time, batch[-1][0])
 
         end_parse_time = time.time()
         parse_duration = end_parse_time - start_parse_time
 
+        # 중단된 경우에는 목록이 완전하지 않으므로 삭제 판단을 하지 않음
+        removed = []
+        if remove_missing and not cancelled:
+            # scandir는 폴더 경로 끝에 구분자가 없을 때만 os.sep을 붙여 하위 경로를 만듦
+            keep_prefixes = tuple(d if d.endswith(("/", "\\")) else d + os.sep for d in (unreadable_dirs or ()))
+            removed = [p for p in file_sigs if p not in seen_paths and not p.startswith(keep_prefixes)]
+        if removed:
+            logger.info(f"삭제된 파일 {len(removed)}개 색인에서 제거")
+
         start_index_time = time.time()
-        writer = self.ix.writer()
-        for (fpath, extension, filename, content, modified) in results:
-            writer.update_document(
-                path=fpath,
-                filename=filename,
-                extension=extension,
-                content=content,
-                modified=modified
-            )
-        writer.commit()
+        if results or removed:
+            with self._write_lock:
+                # 문서가 많은 첫 색인 등에서만 다중 프로세스 writer 사용. 변경 파일이 적은 증분 색인은
+                # 단일 writer가 더 빠름 (Windows에서는 writer 작업자마다 이 모듈 전체를 다시 import).
+                # update_document는 다중 프로세스 쓰기를 막으므로, 기존 문서는 미리 삭제하고 add_document로 추가
+                if len(results) >= self.MP_WRITER_MIN_DOCS:
+                    writer = self.ix.writer(procs=max(2, (os.cpu_count() or 2) // 2), limitmb=256, multisegment=True)
+                else:
+                    writer = self.ix.writer(limitmb=256)
+                try:
+                    for fpath in removed:
+                        writer.delete_by_term("path", fpath)
+                    for (fpath, sig, extension, filename, content, modified) in results:
+                        # 커밋 후 기록 저장 전에 종료되면 기록에 없는 문서가 색인에 남을 수 있으므로 항상 먼저 삭제
+                        writer.delete_by_term("path", fpath)
+                        writer.add_document(
+                            path=fpath,
+                            filename=filename,
+                            extension=extension,
+                            content=content,
+                            excerpt=content[:self.EXCERPT_CHARS],
+                            modified=modified
+                        )
+                    # 세그먼트 병합은 optimize()에서 유휴 시간에 수행
+                    writer.commit(merge=False)
+                except Exception:
+                    # 쓰기 락을 풀고 임시 세그먼트를 버림 (커밋 도중 실패해 이미 닫힌 경우는 제외)
+                    if not writer.is_closed:
+                        writer.cancel()
+                    raise
+                # 커밋에 성공한 뒤에만 기록을 갱신. 실패하면 다음 색인에서 같은 파일을 다시 처리함
+                for fpath in removed:
+                    del file_sigs[fpath]
+                for (fpath, sig, *_) in results:
+                    file_sigs[fpath] = sig
+                self._save_file_sigs()
+                self._cached_search.cache_clear()
         end_index_time = time.time()
         index_duration = end_index_time - start_index_time
         total_duration = parse_duration + index_duration
-        logger.info(f"멀티스레드 파싱: {parse_duration:.2f}초, 인덱싱: {index_duration:.2f}초, 총: {total_duration:.2f}초")
+        logger.info(f"멀티프로세스 파싱: {parse_duration:.2f}초, 인덱싱: {index_duration:.2f}초, 총: {total_duration:.2f}초")
+        if broken_pool is not None:
+            raise broken_pool
+        return seen_files
+
+    def optimize(self) -> None:
+        with self._write_lock:
+            try:
+                with self.ix.reader() as reader:
+                    segment_count = len(reader.leaf_readers())
+                if segment_count <= self.MAX_SEGMENTS:
+                    return
+                self.ix.optimize()
+            except Exception as e:
+                logger.warning(f"인덱스 최적화 실패: {e}")
 
     def search(self, query_str: str, and_mode: bool = False, sort_by: str = "relevance") -> List[dict]:
-        with self.ix.searcher() as searcher:
+        # 캐시된 dict를 호출 쪽에서 바꿔도 캐시에 영향이 없도록 복사해서 반환
+        generation = self.ix.latest_generation()
+        return [dict(hit) for hit in self._cached_search(query_str, and_mode, sort_by, generation)]
+
+    def _get_searcher(self):
+        # _searcher_lock을 잡은 상태에서 호출
+        if self._searcher is None:
+            self._searcher = self.ix.searcher()
+        else:
+            self._searcher = self._searcher.refresh()
+        return self._searcher
+
+    def _close_searcher(self) -> None:
+        with self._searcher_lock:
+            if self._searcher is not None:
+                self._searcher.close()
+                self._searcher = None
+
+    def _search(self, query_str: str, and_mode: bool, sort_by: str, generation: int) -> List[dict]:
+        with self._searcher_lock:
+            searcher = self._get_searcher()
             if and_mode:
                 parser = MultifieldParser(["filename", "content"], schema=self.ix.schema, group=AndGroup)
             else:
@@ -372,22 +755,90 @@ class IndexManager:
             else:
                 results = searcher.search(query, limit=50)
 
-            results.fragmenter.charlimit = None
+            # 미리보기는 표시할 결과에 대해서만 make_snippets()로 따로 생성. 여기서는 본문 검색어만 기록
+            from_bytes = self.ix.schema["content"].from_bytes
+            terms = frozenset(from_bytes(text) for _, text in results.query_terms(expand=True, fieldname="content"))
             hits = []
             for r in results:
                 hits.append({
                     "path": r["path"],
                     "filename": r["filename"],
                     "extension": r["extension"],
-                    "content": r["content"],
-                    "modified": r["modified"]
+                    "modified": r["modified"],
+                    "terms": terms
                 })
             return hits
 
+    def make_snippets(self, hits: List[dict]) -> Iterator[Tuple[str, str, str]]:
+        # 검색 결과마다 (경로, 하이라이트 미리보기, 미리보기를 찾은 본문)을 생성. 저장된 발췌문만 락 안에서 읽고
+        # 하이라이트/재파싱은 락 밖에서 수행하므로 작업 스레드에서 호출해도 검색/색인을 막지 않음
+        with self._searcher_lock:
+            searcher = self._get_searcher()
+            excerpts = []
+            for hit in hits:
+                fields = searcher.document(path=hit["path"]) or {}
+                excerpts.append(fields.get("excerpt") or "")
+        analyzer = self.ix.schema["content"].analyzer
+        # 일치 위치 주변 160자만 생성. 다시 파싱한 전체 본문도 끝까지 찾도록 글자 수 제한은 없앰
+        fragmenter = ContextFragmenter(maxchars=160, surround=60, charlimit=None)
+        formatter = SnippetFormatter()
+        for hit, excerpt in zip(hits, excerpts):
+            text = excerpt
+            snippet = highlight(text, hit["terms"], analyzer, fragmenter, formatter, top=1)
+            if not snippet and hit["terms"] and len(excerpt) >= self.EXCERPT_CHARS:
+                # 발췌문 뒤쪽(여러 쪽짜리 PDF/HWP 등)에서만 일치한 경우 파일을 다시 파싱해 전체 본문에서 찾음
+                text = FileParser.parse_file(hit["path"]) or excerpt
+                snippet = highlight(text, hit["terms"], analyzer, fragmenter, formatter, top=1)
+            yield hit["path"], " ".join(snippet.split()), text
+
+# -------------------------------------------------------------
+# 스니펫 생성용 정규식 (질의마다 재컴파일하지 않도록 캐시)
+# -------------------------------------------------------------
+_WORD_RE = re.compile(r"\b\w+\b")
+
+@lru_cache(maxsize=512)
+def _highlight_re(term: str) -> re.Pattern:
+    return re.compile(rf'\b({re.escape(term)})\b', re.IGNORECASE)
+
+@lru_cache(maxsize=128)
+def _term_pattern(terms: Tuple[str, ...]) -> re.Pattern:
+    """검색어 묶음별로 한 번만 컴파일하는 대소문자 무시 정규식. 본문 복사 없이 한 번에 첫 일치를 찾는다."""
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
+# -------------------------------------------------------------
+# 폴더 변경 이벤트 처리 (watchdog 감시 스레드에서 호출됨)
+# -------------------------------------------------------------
+class DocumentChangeHandler(FileSystemEventHandler):
+    # 색인 대상 문서의 변경과 폴더 삭제/이동만 전달 (색인 폴더 등 다른 파일의 변경은 무시)
+    IGNORED_EVENTS = frozenset({"opened", "closed", "closed_no_write"})
+
+    def __init__(self, on_change: Callable[[], None]) -> None:
+        super().__init__()
+        self.on_change = on_change
+
+    def on_any_event(self, event) -> None:
+        if event.event_type in self.IGNORED_EVENTS:
+            return
+        if event.is_directory:
+            if event.event_type in ("deleted", "moved"):
+                self.on_change()
+            return
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(p and get_extension(os.path.basename(p)) in EXT_SET for p in paths):
+            self.on_change()
+
 # -------------------------------------------------------------
 # OptimizedApp: Tkinter GUI (Progressbar 위치 고정)
 # -------------------------------------------------------------
 class OptimizedApp(DnDTk):
+    # 주기적 자동 색인에서 폴더 수정 시간 확인과 관계없이 전체 순회(파일별 수정 시간/크기 비교)하는 간격 (회)
+    AUTO_FULL_SCAN_EVERY = 6
+    # 폴더 변경 감시 모드에서 감시를 시작할 수 없을 때 대신 쓰는 자동 색인 주기 (분)
+    AUTO_INDEX_FALLBACK_MINUTES = 10
+    # 파싱 프로세스 수 상한과, 마지막 색인 후 풀을 종료하기까지의 유휴 시간 (ms)
+    MAX_PARSE_WORKERS = 8
+    PARSE_POOL_IDLE_MS = 5 * 60 * 1000
+
     def __init__(self) -> None:
         super().__init__()
         self.title("Deepsearch")
@@ -397,16 +848,37 @@ class OptimizedApp(DnDTk):
         create_themed_style(self)
 
         self.monitor_dirs: List[str] = []
+        # 중복 폴더 검사용. monitor_dirs를 바꿀 때 함께 갱신
+        self._monitor_dir_set = set(self.monitor_dirs)
         self.idx_manager = IndexManager()
         self.current_results: List[dict] = []
+        # 검색할 때마다 증가. 이전 검색의 미리보기 결과가 늦게 도착하면 무시
+        self._snippet_token = 0
         self.is_indexing = False
         self.index_cancelled = False
+        # 색인 스레드가 넘긴 최신 진행 상황 (progress, status). Tk 스레드에 반영되기 전까지만 값이 있음
+        self._pending_ui: Optional[Tuple[int, str]] = None
+        self._pending_ui_lock = threading.Lock()
         self.last_index_time: Optional[datetime] = None
         self.auto_index_interval = 0
+        # 마지막으로 완료된 색인에서 순회한 (모니터링 폴더 목록, {폴더: 수정 시간(ns)})
+        self._indexed_dir_mtimes: Optional[Tuple[Tuple[str, ...], dict]] = None
+        self._auto_index_ticks = 0
         self.current_context_path: Optional[str] = None
+        # 자동 색인: 폴더 변경 감시(watchdog) 또는 주기 타이머. after id를 보관해 중복 예약을 막음
+        self._observer = None
+        self._fs_debounce_id: Optional[str] = None
+        self._auto_index_after_id: Optional[str] = None
+        # 파싱 프로세스 풀은 첫 색인 때 만들어 연속된 색인에서 재사용하고, 한동안 색인이 없으면 종료
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_workers = min(os.cpu_count() or 1, self.MAX_PARSE_WORKERS)
+        self._pool_idle_id: Optional[str] = None
+        self._index_thread: Optional[threading.Thread] = None
+        self._closing = False
 
         self._setup_ui()
         self._bind_events()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.after(100, self._show_initial_guide)
         self.update_idletasks()
         self._update_shortcut_info()
@@ -487,21 +959,64 @@ class OptimizedApp(DnDTk):
         self.settings_button.pack(side=tk.LEFT, padx=5)
 
         # ----------------------------
-        # 결과 영역 (스크롤 가능)
+        # 결과 영역 (Treeview: 행 단위 삽입, 화면 밖 행은 그리지 않음)
         # ----------------------------
         results_frame = ttk.Frame(self, style="Card.TFrame")
         results_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0,15))
 
-        self.results_canvas = tk.Canvas(results_frame, bg=COLORS['background'], highlightthickness=0)
-        self.results_scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=self.results_canvas.yview)
-        self.results_canvas.configure(yscrollcommand=self.results_scrollbar.set)
-        self.results_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.guide_frame = ttk.Frame(results_frame, style="Card.TFrame", padding=20)
+        guide_title = ttk.Label(
+            self.guide_frame,
+            text="시작하기",
+            font=(FONTS['default'], FONTS['sizes']['heading'], FONTS['weights']['bold'])
+        )
+        guide_title.pack(pady=10)
+
+        guide_text = (
+            "👉 1. '⚙️ 검색폴더추가' 버튼을 눌러 검색할 폴더를 추가하세요.\n"
+            "👉 2. '🔄 색인' 버튼을 눌러 파일 색인을 진행하세요.\n"
+            "👉 3. 검색창에 키워드를 입력하여 검색하세요.\n"
+            "단축키: Ctrl+F (검색창 포커스), Esc (검색창 초기화)"
+        )
+        guide_label = ttk.Label(
+            self.guide_frame,
+            text=guide_text,
+            font=(FONTS['default'], FONTS['sizes']['large']),
+            wraplength=800,
+            justify="left"
+        )
+        guide_label.pack(pady=10)
 
-        self.results_container = ttk.Frame(self.results_canvas, style="Card.TFrame")
-        self.results_canvas.create_window((0,0), window=self.results_container, anchor="nw")
+        self.tree_frame = ttk.Frame(results_frame, style="Card.TFrame")
 
-        self.results_container.bind("<Configure>", lambda e: self.results_canvas.configure(scrollregion=self.results_canvas.bbox("all")))
+        self.results_tree = ttk.Treeview(
+            self.tree_frame, columns=("name", "modified", "snippet"),
+            style="Results.Treeview", selectmode="browse"
+        )
+        self.results_tree.heading("#0", text="")
+        self.results_tree.heading("name", text="파일명", anchor="w")
+        self.results_tree.heading("modified", text="수정", anchor="w")
+        self.results_tree.heading("snippet", text="미리보기", anchor="w")
+        self.results_tree.column("#0", width=50, stretch=False, anchor="center")
+        self.results_tree.column("name", width=260, stretch=False)
+        self.results_tree.column("modified", width=160, stretch=False)
+        self.results_tree.column("snippet", width=600, stretch=True)
+
+        self.results_scrollbar = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.results_tree.yview)
+        self.results_tree.configure(yscrollcommand=self.results_scrollbar.set)
+
+        # 선택한 결과의 경로와 미리보기를 전체 길이로 보여주는 상세 영역
+        self.detail_var = tk.StringVar()
+        detail_label = ttk.Label(
+            self.tree_frame,
+            textvariable=self.detail_var,
+            font=(FONTS['default'], FONTS['sizes']['normal']),
+            wraplength=1000,
+            justify="left"
+        )
+        detail_label.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(10, 0))
+        self.results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # ----------------------------
         # 하단 상태바
@@ -552,12 +1067,9 @@ class OptimizedApp(DnDTk):
         self.bind("<Control-f>", self._focus_search_entry)
         self.bind("<Escape>", self._clear_search_entry)
 
-        self.results_canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.results_container.bind("<MouseWheel>", self._on_mousewheel)
-        self.results_canvas.bind("<Button-4>", self._on_mousewheel)
-        self.results_canvas.bind("<Button-5>", self._on_mousewheel)
-        self.results_container.bind("<Button-4>", self._on_mousewheel)
-        self.results_container.bind("<Button-5>", self._on_mousewheel)
+        self.results_tree.bind("<<TreeviewSelect>>", self._on_result_select)
+        self.results_tree.bind("<Double-Button-1>", self._on_result_double_click)
+        self.results_tree.bind("<Return>", self._on_result_double_click)
 
     def _update_shortcut_info(self) -> None:
         info = "단축키: Ctrl+F (검색창 포커스), Esc (검색창 초기화)"
@@ -585,46 +1097,11 @@ class OptimizedApp(DnDTk):
     def _clear_search_entry(self, event: tk.Event = None) -> None:
         self.search_entry.delete(0, tk.END)
 
-    # 마우스휠 스크롤
-    def _on_mousewheel(self, event: tk.Event) -> None:
-        if event.num == 4:
-            self.results_canvas.yview_scroll(-1, "units")
-        elif event.num == 5:
-            self.results_canvas.yview_scroll(1, "units")
-        else:
-            scroll_steps = int(-event.delta / 120)
-            self.results_canvas.yview_scroll(scroll_steps, "units")
-
     def _show_initial_guide(self) -> None:
-        if self.results_container.winfo_children():
+        if self.results_tree.get_children():
             return
-        for child in self.results_container.winfo_children():
-            child.destroy()
-
-        guide_frame = ttk.Frame(self.results_container, style="Card.TFrame", padding=20)
-        guide_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        guide_title = ttk.Label(
-            guide_frame,
-            text="시작하기",
-            font=(FONTS['default'], FONTS['sizes']['heading'], FONTS['weights']['bold'])
-        )
-        guide_title.pack(pady=10)
-
-        guide_text = (
-            "👉 1. '⚙️ 검색폴더추가' 버튼을 눌러 검색할 폴더를 추가하세요.\n"
-            "👉 2. '🔄 색인' 버튼을 눌러 파일 색인을 진행하세요.\n"
-            "👉 3. 검색창에 키워드를 입력하여 검색하세요.\n"
-            "단축키: Ctrl+F (검색창 포커스), Esc (검색창 초기화)"
-        )
-        guide_label = ttk.Label(
-            guide_frame,
-            text=guide_text,
-            font=(FONTS['default'], FONTS['sizes']['large']),
-            wraplength=800,
-            justify="left"
-        )
-        guide_label.pack(pady=10)
+        self.tree_frame.pack_forget()
+        self.guide_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
     # --------------------------------------------------
     # 검색 및 결과 표시
@@ -640,77 +1117,100 @@ class OptimizedApp(DnDTk):
 
         results = self.idx_manager.search(query, and_mode, sort_by)
 
-        filtered = []
-        for r in results:
-            ext = r["extension"]
-            if ext == ".hwp" and not self.filter_hwp.get():
-                continue
-            if ext == ".hwpx" and not self.filter_hwpx.get():
-                continue
-            if ext == ".pdf" and not self.filter_pdf.get():
-                continue
-            if ext in (".xls", ".xlsx") and not self.filter_excel.get():
-                continue
-            filtered.append(r)
+        # 필터 체크박스는 질의당 한 번만 읽음
+        allowed = set()
+        if self.filter_hwp.get():
+            allowed.add(".hwp")
+        if self.filter_hwpx.get():
+            allowed.add(".hwpx")
+        if self.filter_pdf.get():
+            allowed.add(".pdf")
+        if self.filter_excel.get():
+            allowed.update((".xls", ".xlsx"))
+        allowed = frozenset(allowed)
+        filtered = [r for r in results if r["extension"] in allowed]
 
         self.current_results = filtered
         self._update_result_list(query, filtered)
 
     def _update_result_list(self, query: str, results: List[dict]) -> None:
-        for child in self.results_container.winfo_children():
-            child.destroy()
+        # 진행 중인 미리보기 생성 결과는 버림
+        self._snippet_token += 1
+        tree = self.results_tree
+        tree.delete(*tree.get_children())
+        self.detail_var.set("")
 
         if not results:
             self._show_initial_guide()
             self.status_var.set("검색 결과가 없습니다.")
             return
 
-        for r in results:
-            card = ttk.Frame(self.results_container, style="Card.TFrame", padding=10)
-            card.pack(fill=tk.X, padx=10, pady=5)
-
-            icon_label = ttk.Label(
-                card,
-                text=self._get_icon(r["extension"]),
-                font=(FONTS['default'], FONTS['sizes']['heading'])
-            )
-            icon_label.grid(row=0, column=0, rowspan=2, padx=10, sticky="n")
-
-            fname = ttk.Label(
-                card,
-                text=f"[{r['filename']}]",
-                font=(FONTS['default'], FONTS['sizes']['large'], FONTS['weights']['bold'])
-            )
-            fname.grid(row=0, column=1, sticky="w")
-            fname.config(cursor="hand2")
+        self.guide_frame.pack_forget()
+        self.tree_frame.pack(fill=tk.BOTH, expand=True)
 
+        # 경로를 행 id로 쓰므로 색인에 같은 경로의 문서가 중복되어 있어도 한 번만 표시
+        seen_paths = set()
+        unique_results = []
+        for r in results:
+            if r["path"] not in seen_paths:
+                seen_paths.add(r["path"])
+                unique_results.append(r)
+        results = unique_results
+        for r in results:
             mod_time = r.get("modified")
             mod_str = mod_time.strftime("%Y-%m-%d %H:%M:%S") if isinstance(mod_time, datetime) else ""
-            mod_label = ttk.Label(
-                card,
-                text=f"수정: {mod_str}",
-                font=(FONTS['default'], FONTS['sizes']['small']),
-                foreground=COLORS['text_secondary']
-            )
-            mod_label.grid(row=0, column=2, sticky="e", padx=10)
-
-            snippet = self._generate_snippet(r["content"], query)
-            snippet_label = ttk.Label(
-                card,
-                text=snippet,
-                font=(FONTS['default'], FONTS['sizes']['normal']),
-                wraplength=800,
-                justify="left"
+            tree.insert(
+                "", tk.END, iid=r["path"],
+                text=self._get_icon(r["extension"]),
+                values=(r["filename"], mod_str, "")
             )
-            snippet_label.grid(row=1, column=1, columnspan=2, sticky="w", pady=5)
-
-            # 더블클릭으로 파일 열기
-            card.bind("<Double-Button-1>", lambda e, path=r["path"]: self._open_file(path))
-            fname.bind("<Double-Button-1>", lambda e, path=r["path"]: self._open_file(path))
-            for widget in card.winfo_children():
-                widget.bind("<Double-Button-1>", lambda e, path=r["path"]: self._open_file(path))
 
         self.status_var.set(f"총 {len(results)}개 문서 검색됨")
+        # 미리보기는 표시한 결과에 대해서만 작업 스레드에서 만들고 Tk 스레드에서 반영
+        threading.Thread(target=self._load_snippets, args=(self._snippet_token, query, results), daemon=True).start()
+
+    def _load_snippets(self, token: int, query: str, results: List[dict]) -> None:
+        rows = []
+        try:
+            for path, snippet, text in self.idx_manager.make_snippets(results):
+                if token != self._snippet_token:
+                    return
+                if snippet:
+                    rows.append((path, f"→ {snippet}"))
+                else:
+                    # 파일명만 일치했거나 검색어가 단어의 일부로만 나와 하이라이트되지 않은 경우 본문에서 직접 찾음
+                    rows.append((path, self._generate_snippet(text, query)))
+        except Exception as e:
+            logger.error(f"미리보기 생성 오류: {e}")
+        self.after(0, self._apply_snippets, token, rows)
+
+    def _apply_snippets(self, token: int, rows: List[Tuple[str, str]]) -> None:
+        if token != self._snippet_token:
+            return
+        tree = self.results_tree
+        for path, snippet in rows:
+            if tree.exists(path):
+                tree.set(path, "snippet", snippet)
+        self._on_result_select(None)
+
+    def _on_result_select(self, event: tk.Event) -> None:
+        selection = self.results_tree.selection()
+        if not selection:
+            self.detail_var.set("")
+            return
+        path = selection[0]
+        snippet = self.results_tree.set(path, "snippet")
+        self.detail_var.set(f"{path}\n{snippet}")
+
+    def _on_result_double_click(self, event: tk.Event) -> None:
+        # 더블클릭/Enter로 파일 열기
+        if event.type == tk.EventType.KeyPress:
+            selection = self.results_tree.selection()
+            path = selection[0] if selection else ""
+        else:
+            path = self.results_tree.identify_row(event.y)
+        if path:
+            self._open_file(path)
 
     def _get_icon(self, extension: str) -> str:
         if extension in (".hwp", ".hwpx"):
@@ -722,19 +1222,17 @@ class OptimizedApp(DnDTk):
         return "🗂️"
 
     def _generate_snippet(self, content: str, query: str) -> str:
-        lines = content.split("\n")
-        query_terms = re.findall(r"\b\w+\b", query.lower())
-        snippet_line = None
-        for line in lines:
-            if any(term in line.lower() for term in query_terms):
-                snippet_line = line.strip()
-                break
-        if snippet_line:
+        query_terms = _WORD_RE.findall(query.lower())
+        match = _term_pattern(tuple(query_terms)).search(content) if query_terms else None
+        if match:
+            line_start = content.rfind("\n", 0, match.start()) + 1
+            line_end = content.find("\n", match.end())
+            snippet_line = content[line_start:line_end if line_end != -1 else len(content)].strip()
             snippet = snippet_line[:100] + "..." if len(snippet_line) > 100 else snippet_line
             for term in query_terms:
-                snippet = re.sub(rf'\b({re.escape(term)})\b', r'**\1**', snippet, flags=re.IGNORECASE)
+                snippet = _highlight_re(term).sub(r'**\1**', snippet)
             return f"→ {snippet}"
-        return "→ [내용 미리보기 없음]" if lines else ""
+        return "→ [내용 미리보기 없음]"
 
     def _open_file(self, path: str) -> None:
         if os.path.exists(path):
@@ -752,6 +1250,8 @@ class OptimizedApp(DnDTk):
     # 색인(Re-index)
     # --------------------------------------------------
     def reindex_files(self) -> None:
+        if self._closing:
+            return
         if self.is_indexing:
             self.index_cancelled = True
             self.status_var.set("색인 중단 요청 중...")
@@ -761,62 +1261,132 @@ class OptimizedApp(DnDTk):
             messagebox.showwarning("경고", "먼저 모니터링 폴더를 설정해주세요.")
             return
 
-        def thread_target() -> None:
-            self.is_indexing = True
-            self.index_cancelled = False
-            self.progress_var.set(0)
-            self.status_var.set("색인 초기화 중...")
-            self.reindex_button.config(text="⏹ 색인 중단")
-            self.settings_button.config(state=tk.DISABLED)
-            self.search_button.config(state=tk.DISABLED)
-            self.update_idletasks()
-            time.sleep(0.3)
-
-            self.idx_manager.clear_index()
-            files = self._collect_files()
-            total = len(files)
-            if total == 0:
-                self.status_var.set("색인할 파일이 없습니다.")
-                self.is_indexing = False
-                self.reindex_button.config(text="🔄 색인")
-                self.settings_button.config(state=tk.NORMAL)
-                self.search_button.config(state=tk.NORMAL)
-                return
-
-            def progress_callback(current: int, total_files: int, elapsed: float) -> None:
-                progress = int((current / total_files) * 100)
-                remaining = 0
-                if current > 0:
-                    remaining = int((elapsed / current) * (total_files - current))
+        # Tk는 스레드 안전하지 않으므로 위젯 변경은 Tk 스레드에서만 수행.
+        # 색인 스레드에서는 self.after(0, ...)로 넘김
+        self.is_indexing = True
+        self.index_cancelled = False
+        if self._pool_idle_id is not None:
+            self.after_cancel(self._pool_idle_id)
+            self._pool_idle_id = None
+        self.progress_var.set(0)
+        self.status_var.set("색인 초기화 중...")
+        self.reindex_button.config(text="⏹ 색인 중단")
+        self.settings_button.config(state=tk.DISABLED)
+        self.search_button.config(state=tk.DISABLED)
+
+        def apply_progress() -> None:
+            with self._pending_ui_lock:
+                pending, self._pending_ui = self._pending_ui, None
+            if pending is not None:
+                progress, status = pending
                 self.progress_var.set(progress)
-                filename = os.path.basename(files[current - 1]) if current - 1 < len(files) else ""
-                self.status_var.set(f"색인 중... ({current}/{total_files}) {filename} | 남은 시간: {remaining}s")
-                self.update_idletasks()
+                self.status_var.set(status)
 
-            start_time = time.time()
-            self.idx_manager.index_files(
-                files,
-                progress_callback,
-                cancel_callback=lambda: self.index_cancelled,
-                max_workers=6
-            )
-            elapsed_time = time.time() - start_time
-
-            if self.index_cancelled:
-                self.status_var.set("색인 중단됨")
-            else:
-                self.status_var.set(f"색인 완료 ({total}개, {elapsed_time:.2f}초 소요)")
+        def finish(status: str, completed: bool) -> None:
+            self.status_var.set(status)
+            if completed:
                 self.last_index_time = datetime.now()
                 self.last_index_label.config(text=f"마지막 색인: {self.last_index_time.strftime('%Y-%m-%d %H:%M:%S')}")
-
             self.progress_var.set(100)
             self.is_indexing = False
             self.reindex_button.config(text="🔄 색인")
             self.settings_button.config(state=tk.NORMAL)
             self.search_button.config(state=tk.NORMAL)
-            self.update_idletasks()
+            self._pool_idle_id = self.after(self.PARSE_POOL_IDLE_MS, self._shutdown_idle_parse_pool)
+
+        def thread_target() -> None:
+            self.after(0, lambda: self.status_var.set("색인할 파일을 찾는 중..."))
 
-        threading.Thread(target=thread_target, daemon=True).start()
+            last_ui_update = [0.0]
+
+            def progress_callback(current: int, total_files: int, elapsed: float, path: str) -> None:
+                # UI 갱신은 최대 100ms에 한 번. 아직 반영되지 않은 갱신이 있으면 값만 바꾸고 다시 예약하지 않음
+                now = time.monotonic()
+                if now - last_ui_update[0] < 0.1 and current != total_files:
+                    return
+                last_ui_update[0] = now
+                progress = int((current / total_files) * 100)
+                remaining = 0
+                if current > 0:
+                    remaining = int((elapsed / current) * (total_files - current))
+                filename = os.path.basename(path)
+                status = f"색인 중... ({current}/{total_files}) {filename} | 남은 시간: {remaining}s"
+                with self._pending_ui_lock:
+                    scheduled = self._pending_ui is not None
+                    self._pending_ui = (progress, status)
+                if not scheduled:
+                    self.after(0, apply_progress)
+
+            start_time = time.time()
+            monitor_dirs = tuple(self.monitor_dirs)
+            dir_mtimes = {}
+            failed_dirs = set()
+
+            def run_index() -> int:
+                dir_mtimes.clear()
+                failed_dirs.clear()
+                # 중단/오류로 소비를 멈추면 바로 생성기를 닫아 폴더 순회 스레드를 멈춤
+                with closing(self._collect_files(dir_mtimes, failed_dirs)) as file_entries:
+                    return self.idx_manager.index_files(
+                        file_entries,
+                        progress_callback,
+                        cancel_callback=lambda: self.index_cancelled,
+                        max_workers=self._parse_workers,
+                        remove_missing=True,
+                        executor=self._get_parse_pool(),
+                        unreadable_dirs=failed_dirs
+                    )
+
+            # 어떤 오류가 나도 finish는 항상 예약해 버튼/진행 상태가 색인 중으로 남지 않게 함
+            status, completed = "색인 실패", False
+            try:
+                try:
+                    total = run_index()
+                except BrokenProcessPool:
+                    # 작업자 프로세스가 비정상 종료되면 풀을 새로 만들어 한 번 더 시도 (이미 커밋된 파일은 건너뜀)
+                    logger.warning("파싱 프로세스 풀을 다시 생성합니다.")
+                    self._discard_parse_pool()
+                    total = run_index()
+                elapsed_time = time.time() - start_time
+                if not self.index_cancelled:
+                    # 읽지 못한 폴더가 있었으면 다음 자동 색인에서 변경 여부와 관계없이 다시 순회
+                    self._indexed_dir_mtimes = None if failed_dirs else (monitor_dirs, dir_mtimes)
+
+                if self.index_cancelled:
+                    status = "색인 중단됨"
+                elif total == 0:
+                    status = "색인할 파일이 없습니다."
+                else:
+                    status, completed = f"색인 완료 ({total}개, {elapsed_time:.2f}초 소요)", True
+            except Exception as e:
+                logger.error(f"[reindex_files] 색인 오류: {e}")
+                status = f"색인 실패: {e}"
+                if isinstance(e, BrokenProcessPool):
+                    self._discard_parse_pool()
+            finally:
+                self.after(0, finish, status, completed)
+
+            # 색인 중 분할 저장된 세그먼트가 많이 쌓였으면 검색에 지장 없도록 백그라운드에서 병합
+            self.idx_manager.optimize()
+
+        self._index_thread = threading.Thread(target=thread_target, daemon=True)
+        self._index_thread.start()
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        # 색인 스레드에서 호출. 유휴 종료는 색인 중이 아닐 때만 하므로 서로 겹치지 않음
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self._parse_workers, initializer=init_parse_worker)
+        return self._parse_pool
+
+    def _discard_parse_pool(self) -> None:
+        pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _shutdown_idle_parse_pool(self) -> None:
+        self._pool_idle_id = None
+        if not self.is_indexing:
+            self._discard_parse_pool()
 
     # --------------------------------------------------
     # 설정(검색폴더) 관련
@@ -857,13 +1427,21 @@ class OptimizedApp(DnDTk):
         auto_frame = ttk.Frame(win, style="Card.TFrame")
         auto_frame.pack(fill=tk.X, padx=15, pady=10)
 
-        ttk.Label(
-            auto_frame, text="자동 색인 주기 (분, 0=미사용):"
-        ).pack(side=tk.LEFT)
-        self.auto_index_var = tk.StringVar(value=str(self.auto_index_interval))
-        auto_spin = ttk.Spinbox(auto_frame, from_=0, to=60, textvariable=self.auto_index_var,
-                                width=5)
-        auto_spin.pack(side=tk.LEFT, padx=5)
+        if Observer is not None:
+            # 폴더 변경 알림으로 색인하므로 주기 대신 사용 여부만 선택
+            self.auto_index_var = tk.BooleanVar(value=self.auto_index_interval > 0)
+            ttk.Checkbutton(
+                auto_frame, text="폴더 변경 시 자동 색인", variable=self.auto_index_var,
+                style="Filter.TCheckbutton"
+            ).pack(side=tk.LEFT)
+        else:
+            ttk.Label(
+                auto_frame, text="자동 색인 주기 (분, 0=미사용):"
+            ).pack(side=tk.LEFT)
+            self.auto_index_var = tk.StringVar(value=str(self.auto_index_interval))
+            auto_spin = ttk.Spinbox(auto_frame, from_=0, to=60, textvariable=self.auto_index_var,
+                                    width=5)
+            auto_spin.pack(side=tk.LEFT, padx=5)
 
         btn_frame = ttk.Frame(win, style="Card.TFrame")
         btn_frame.pack(fill=tk.X, padx=15, pady=5)
@@ -880,23 +1458,31 @@ class OptimizedApp(DnDTk):
         info_label.pack(side=tk.BOTTOM, pady=10, anchor=tk.W, padx=15)
 
         def apply_settings():
-            try:
-                self.auto_index_interval = int(self.auto_index_var.get())
-            except:
-                self.auto_index_interval = 0
+            if Observer is not None:
+                self.auto_index_interval = self.AUTO_INDEX_FALLBACK_MINUTES if self.auto_index_var.get() else 0
+            else:
+                try:
+                    self.auto_index_interval = int(self.auto_index_var.get())
+                except:
+                    self.auto_index_interval = 0
             messagebox.showinfo("알림", "설정이 적용되었습니다.")
             win.destroy()
-            if self.auto_index_interval > 0:
-                self._schedule_auto_index()
+            self._configure_auto_index()
 
         ttk.Button(win, text="설정 적용", command=apply_settings).pack(pady=10)
 
     def _on_drop(self, event: tk.Event) -> None:
         dropped = self.tk.splitlist(event.data)
+        added = False
         for path in dropped:
-            if os.path.isdir(path) and path not in self.monitor_dirs:
+            if os.path.isdir(path) and path not in self._monitor_dir_set:
                 self.monitor_dirs.append(path)
+                self._monitor_dir_set.add(path)
                 self.dir_list.insert(tk.END, path)
+                added = True
+        if added:
+            # 감시 중인 폴더 목록도 바로 갱신
+            self._configure_auto_index()
 
     def _remove_folder_event(self, event: tk.Event) -> None:
         self._remove_folder()
@@ -906,9 +1492,12 @@ class OptimizedApp(DnDTk):
             messagebox.showwarning("경고", "최대 5개 폴더까지 추가 가능합니다.")
             return
         folder = filedialog.askdirectory(parent=parent, title="모니터링 폴더 선택")
-        if folder and folder not in self.monitor_dirs:
+        if folder and folder not in self._monitor_dir_set:
             self.monitor_dirs.append(folder)
+            self._monitor_dir_set.add(folder)
             self.dir_list.insert(tk.END, folder)
+            # 감시 중인 폴더 목록도 바로 갱신
+            self._configure_auto_index()
             if self.monitor_dirs and self.search_entry.get() == "먼저 검색폴더를 추가해주세요":
                 self.search_entry.delete(0, tk.END)
                 self.search_entry.insert(0, "검색어를 입력하세요")
@@ -921,37 +1510,164 @@ class OptimizedApp(DnDTk):
             return
         idx = sel[0]
         removed_folder = self.monitor_dirs.pop(idx)
+        self._monitor_dir_set.discard(removed_folder)
         self.dir_list.delete(idx)
+        self._configure_auto_index()
         messagebox.showinfo("알림", f"폴더 '{removed_folder}'가 제거되었습니다.")
         if not self.monitor_dirs:
             self.search_entry.delete(0, tk.END)
             self.search_entry.insert(0, "먼저 검색폴더를 추가해주세요")
             self.search_entry.config(foreground="gray")
 
-    def _collect_files(self) -> List[str]:
-        exts = [".hwp", ".hwpx", ".pdf", ".xls", ".xlsx"]
-        files = []
-        for d in self.monitor_dirs:
-            for root, _, files_in_dir in os.walk(d):
-                for f in files_in_dir:
-                    if os.path.splitext(f)[1].lower() in exts:
-                        files.append(os.path.join(root, f))
-        return files
+    def _collect_files(self,
+                       dir_mtimes: Optional[dict] = None,
+                       failed_dirs: Optional[set] = None) -> Iterator[Tuple[str, int, int]]:
+        monitor_dirs = list(self.monitor_dirs)
+        if not monitor_dirs:
+            return
+        # 폴더별 순회는 서로 독립이고 scandir/stat 시스템 호출 중에는 GIL이 풀리므로 폴더마다 스레드로 병렬 순회.
+        # 찾은 파일은 하위 폴더 단위로 큐에 바로 넘겨 전체 순회가 끝나기 전에 색인을 시작하고,
+        # 모니터링 폴더 순회가 끝나면 None을 넣음
+        found = queue.Queue()
+        # 소비를 멈추면(중단/종료/재시도) 남은 순회도 멈춤. 멈추지 않으면 프로그램 종료 시 스레드를 기다림
+        stop = threading.Event()
+
+        def walk(directory: str) -> None:
+            try:
+                for batch in iter_document_batches(directory, dir_mtimes, failed_dirs, stop):
+                    found.put(batch)
+            except Exception as e:
+                # 순회가 중간에 끝났으므로 읽지 못한 폴더로 취급해 이 폴더의 문서를 색인에서 지우지 않음
+                logger.error(f"폴더 순회 오류: {directory}, {e}")
+                if failed_dirs is not None:
+                    failed_dirs.add(directory)
+            finally:
+                found.put(None)
+
+        executor = ThreadPoolExecutor(max_workers=min(len(monitor_dirs), 8))
+        try:
+            for d in monitor_dirs:
+                executor.submit(walk, d)
+            remaining = len(monitor_dirs)
+            while remaining:
+                batch = found.get()
+                if batch is None:
+                    remaining -= 1
+                else:
+                    yield from batch
+        finally:
+            # 색인이 중단되어 소비를 멈춰도 기다리지 않음 (진행 중인 폴더의 결과만 큐에 쌓이고 버려짐)
+            stop.set()
+            executor.shutdown(wait=False)
+
+    def _configure_auto_index(self) -> None:
+        # watchdog이 있으면 폴더 변경 알림이 올 때만 색인하고, 없거나 감시를 시작할 수 없으면 주기적으로 색인
+        if self._auto_index_after_id is not None:
+            self.after_cancel(self._auto_index_after_id)
+            self._auto_index_after_id = None
+        self._stop_watching()
+        if self.auto_index_interval <= 0 or not self.monitor_dirs:
+            return
+        if Observer is not None and self._start_watching():
+            return
+        self._schedule_auto_index()
+
+    def _start_watching(self) -> bool:
+        observer = Observer()
+        handler = DocumentChangeHandler(lambda: self.after(0, self._on_fs_change))
+        try:
+            for d in self.monitor_dirs:
+                observer.schedule(handler, d, recursive=True)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            logger.warning(f"폴더 변경 감시 시작 실패, 주기적 색인으로 대체: {e}")
+            return False
+        self._observer = observer
+        return True
+
+    def _stop_watching(self) -> None:
+        if self._fs_debounce_id is not None:
+            self.after_cancel(self._fs_debounce_id)
+            self._fs_debounce_id = None
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def _on_fs_change(self) -> None:
+        # 저장/복사 중에는 이벤트가 연달아 오므로 마지막 이벤트 후 2초간 변화가 없을 때 색인
+        if self._fs_debounce_id is not None:
+            self.after_cancel(self._fs_debounce_id)
+        self._fs_debounce_id = self.after(2000, self._index_after_fs_change)
+
+    def _index_after_fs_change(self) -> None:
+        self._fs_debounce_id = None
+        if self.is_indexing:
+            # 진행 중인 색인이 이미 지나간 폴더의 변경일 수 있으므로 끝난 뒤 다시 시도
+            self._on_fs_change()
+            return
+        self.reindex_files()
 
     def _schedule_auto_index(self) -> None:
         interval_ms = self.auto_index_interval * 60 * 1000
         if interval_ms > 0:
-            self.after(interval_ms, self._auto_index)
+            self._auto_index_after_id = self.after(interval_ms, self._auto_index)
 
     def _auto_index(self) -> None:
+        self._auto_index_after_id = None
         if not self.is_indexing:
-            self.reindex_files()
+            # 제자리에서 내용만 바뀐 파일은 폴더 수정 시간으로 알 수 없으므로 AUTO_FULL_SCAN_EVERY회마다 전체 순회
+            self._auto_index_ticks += 1
+            full_scan = self._auto_index_ticks % self.AUTO_FULL_SCAN_EVERY == 0
+            # 폴더 stat은 네트워크 드라이브에서 느릴 수 있으므로 별도 스레드에서 확인
+            threading.Thread(target=self._auto_index_if_changed, args=(full_scan,), daemon=True).start()
         self._schedule_auto_index()
 
+    def _auto_index_if_changed(self, full_scan: bool = False) -> None:
+        if full_scan or self._dirs_changed():
+            self.after(0, lambda: None if self.is_indexing else self.reindex_files())
+
+    def _dirs_changed(self) -> bool:
+        # 파일 추가/삭제/이름 변경은 상위 폴더의 수정 시간을 바꾸므로, 지난 색인 때 순회한 폴더만 stat해서
+        # 바뀐 폴더가 없으면 전체 순회를 생략. 저장 시 임시 파일을 쓰지 않고 제자리에서 내용만 바뀐 파일은
+        # 이 방법으로 알 수 없으므로 _auto_index의 주기적 전체 순회(파일별 수정 시간/크기 비교)로 반영
+        if self._indexed_dir_mtimes is None:
+            return True
+        monitor_dirs, dir_mtimes = self._indexed_dir_mtimes
+        if monitor_dirs != tuple(self.monitor_dirs):
+            return True
+        for path, mtime_ns in dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _on_close(self) -> None:
+        self._closing = True
+        self._stop_watching()
+        self.index_cancelled = True
+        if self._index_thread is not None and self._index_thread.is_alive():
+            # 색인 스레드가 self.after로 Tk를 호출하므로 Tk 스레드에서 join하지 않고, 창을 숨긴 채 끝날 때까지 확인
+            self.withdraw()
+            self.after(100, self._on_close)
+            return
+        pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            # 중단 직전에 시작된 묶음이 남아 있으면 종료 시 기다리지 않도록 작업자 프로세스를 끝냄.
+            # shutdown()이 프로세스 목록을 비우므로 먼저 가져옴
+            processes = list((getattr(pool, "_processes", None) or {}).values())
+            pool.shutdown(wait=False, cancel_futures=True)
+            for process in processes:
+                process.terminate()
+        self.destroy()
+
     def run(self) -> None:
         self.mainloop()
 
 # 메인
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = OptimizedApp()
     app.run()